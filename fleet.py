@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Fleet Simulation 🚦
+===================
+Batch simulator for many vehicles from polymorphism.py.
+
+Instead of one Python object per vehicle, the numeric state of the whole
+fleet lives in parallel NumPy arrays (one array per attribute), and a
+Numba-compiled kernel advances every vehicle in a single call.
+
+Requires NumPy (pip install .[fleet]). Numba is optional
+(pip install .[jit]) - without it the same kernel runs as plain Python,
+which is correct but much slower.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba not installed: run the kernel uncompiled
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+@njit(parallel=True, fastmath=True)
+def step(dt, accel, fuel_rate, current, max_speed, fuel, distance, moving):
+    """Advance every vehicle by one tick of dt hours (arrays updated in place)"""
+    for i in prange(current.shape[0]):
+        if moving[i]:
+            current[i] = min(max_speed[i], current[i] + accel)
+            fuel[i] = max(0.0, fuel[i] - fuel_rate)
+            distance[i] += current[i] * dt
+            if fuel[i] == 0.0:
+                # Out of fuel - the vehicle coasts to a stop
+                current[i] = 0.0
+                moving[i] = False
+
+def _as_number(value):
+    """Convert an array element to int when whole, otherwise float"""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+class VehicleFleet:
+    """Structure-of-arrays container for the numeric state of many vehicles"""
+    
+    __slots__ = ('current_speed', 'max_speed', 'fuel_level', 'distance', 'is_moving')
+    
+    def __init__(self, size):
+        self.current_speed = np.zeros(size, dtype=np.float32)
+        self.max_speed = np.zeros(size, dtype=np.float32)
+        self.fuel_level = np.full(size, 100.0, dtype=np.float32)  # percentage
+        self.distance = np.zeros(size, dtype=np.float32)  # in km
+        self.is_moving = np.zeros(size, dtype=np.bool_)
+    
+    @classmethod
+    def from_vehicles(cls, vehicles):
+        """Build a fleet from existing Vehicle objects (index i is vehicles[i])"""
+        fleet = cls(len(vehicles))
+        for i, vehicle in enumerate(vehicles):
+            fleet.current_speed[i] = vehicle.current_speed
+            fleet.max_speed[i] = vehicle.max_speed
+            fleet.fuel_level[i] = vehicle.fuel_level
+            fleet.distance[i] = vehicle.distance_traveled
+            fleet.is_moving[i] = vehicle.is_moving
+        return fleet
+    
+    def __len__(self):
+        return self.current_speed.shape[0]
+    
+    def simulate(self, dt=1/60, accel=5.0, fuel_rate=0.01, ticks=1):
+        """Run the simulation for a number of ticks"""
+        for _ in range(ticks):
+            step(dt, accel, fuel_rate, self.current_speed, self.max_speed,
+                 self.fuel_level, self.distance, self.is_moving)
+    
+    def apply_to(self, vehicles):
+        """Copy the simulated state back onto the matching Vehicle objects"""
+        for i, vehicle in enumerate(vehicles):
+            # Only touch fields that changed, so untouched vehicles keep their ints
+            speed = _as_number(self.current_speed[i])
+            if speed != vehicle.current_speed:
+                vehicle.current_speed = speed
+            fuel = _as_number(round(float(self.fuel_level[i]), 2))
+            if fuel != vehicle.fuel_level:
+                vehicle.fuel_level = fuel
+            distance = _as_number(self.distance[i])
+            if distance != vehicle.distance_traveled:
+                vehicle.distance_traveled = distance
+            if vehicle.is_moving and not self.is_moving[i]:
+                vehicle._halt()  # Ran out of fuel; also resets altitude, anchor, etc.
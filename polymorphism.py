@@ -12,14 +12,47 @@ Key Concepts Demonstrated:
 4. Interface consistency across different classes
 """
 
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 import random
 import time
 
+# Local alias of the shared (seedable) generator
+_choice = random.choice
+
+# Banner rules
+_BANNER = "=" * 65
+_SUBBAR = "=" * 60
+
+class _AbstractMeta(type):
+    """Lightweight metaclass that records abstract methods without ABCMeta's registry"""
+    
+    def __new__(mcls, name, bases, namespace, **kwargs):
+        cls = super().__new__(mcls, name, bases, namespace, **kwargs)
+        abstracts = {key for key, value in namespace.items()
+                     if getattr(value, "__isabstractmethod__", False)}
+        for base in bases:
+            for key in getattr(base, "__abstractmethods__", ()):
+                if getattr(getattr(cls, key, None), "__isabstractmethod__", False):
+                    abstracts.add(key)
+        # type.__call__ refuses to instantiate classes with a non-empty set
+        cls.__abstractmethods__ = frozenset(abstracts)
+        return cls
+
 # Abstract base class defining the interface
-class Vehicle(ABC):
+class Vehicle(metaclass=_AbstractMeta):
     """Abstract base class for all vehicles"""
     
+    __slots__ = ('name', 'max_speed', 'fuel_type', 'capacity', 'current_speed',
+                 'is_moving', 'fuel_level', 'distance_traveled')
+    
+    # Dramatic pauses are only wanted in the interactive demo
+    _ANIMATE = False
+    _TYPE_NAME = "Vehicle"
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._TYPE_NAME = cls.__name__  # Cached for get_info() and __str__
+    
     def __init__(self, name, max_speed, fuel_type, capacity):
         self.name = name
         self.max_speed = max_speed  # in km/h
@@ -45,6 +78,11 @@ class Vehicle(ABC):
         """Abstract method - each vehicle makes different sounds"""
         pass
     
+    def _halt(self):
+        """Bring the vehicle to rest; subclasses also reset their own motion state"""
+        self.current_speed = 0
+        self.is_moving = False
+    
     def accelerate(self, speed_increase):
         """Common method that can be overridden"""
         if self.is_moving:
@@ -59,7 +97,7 @@ class Vehicle(ABC):
         status = "Moving" if self.is_moving else "Stopped"
         return {
             'name': self.name,
-            'type': self.__class__.__name__,
+            'type': self._TYPE_NAME,
             'max_speed': self.max_speed,
             'current_speed': self.current_speed,
             'fuel_type': self.fuel_type,
@@ -70,13 +108,16 @@ class Vehicle(ABC):
         }
     
     def __str__(self):
-        return f"{self.__class__.__name__}: {self.name}"
+        return f"{self._TYPE_NAME}: {self.name}"
 
 # Concrete vehicle classes demonstrating polymorphism
 
 class Car(Vehicle):
     """Car class with specific movement behavior"""
     
+    __slots__ = ('gear', 'doors')
+    _SOUNDS = ("Vroom vroom! 🏎️", "Beep beep! 📯", "Engine purring... 🚗")
+    
     def __init__(self, name, max_speed=180, capacity=5):
         super().__init__(name, max_speed, "Gasoline", capacity)
         self.gear = 1
@@ -96,17 +137,16 @@ class Car(Vehicle):
         """Car-specific stopping implementation"""
         if self.is_moving:
             print(f"🛑 {self.name} is braking and coming to a stop...")
-            time.sleep(0.5)
-            self.current_speed = 0
-            self.is_moving = False
+            if self._ANIMATE:
+                time.sleep(0.5)
+            self._halt()
             print(f"🚗 {self.name} has stopped and parked.")
         else:
             print(f"🚗 {self.name} is already stopped!")
     
     def make_sound(self):
         """Car-specific sound"""
-        sounds = ["Vroom vroom! 🏎️", "Beep beep! 📯", "Engine purring... 🚗"]
-        print(f"🔊 {random.choice(sounds)}")
+        print(f"🔊 {_choice(self._SOUNDS)}")
     
     def shift_gear(self, gear):
         """Car-specific method"""
@@ -119,6 +159,9 @@ class Car(Vehicle):
 class Plane(Vehicle):
     """Airplane class with specific movement behavior"""
     
+    __slots__ = ('altitude', 'is_airborne')
+    _SOUNDS = ("WHOOOOSH! 🌪️", "Jet engines roaring! ✈️", "Turbulence rumbling... 🌩️")
+    
     def __init__(self, name, max_speed=900, capacity=200):
         super().__init__(name, max_speed, "Jet Fuel", capacity)
         self.altitude = 0
@@ -128,13 +171,15 @@ class Plane(Vehicle):
         """Plane-specific movement implementation"""
         if not self.is_moving:
             print(f"✈️ {self.name} is taxiing to the runway...")
-            time.sleep(1)
-            print(f"✈️ {self.name} is taking off...")
+            if self._ANIMATE:
+                time.sleep(1)
             self.is_moving = True
             self.is_airborne = True
             self.current_speed = 250
             self.altitude = 1000
-            print(f"✈️ {self.name} is flying at {self.current_speed} km/h, altitude {self.altitude}m")
+            # One write for both lines instead of a print() each
+            print(f"✈️ {self.name} is taking off...\n"
+                  f"✈️ {self.name} is flying at {self.current_speed} km/h, altitude {self.altitude}m")
             self.make_sound()
         else:
             print(f"✈️ {self.name} is already flying!")
@@ -142,21 +187,24 @@ class Plane(Vehicle):
     def stop(self):
         """Plane-specific stopping implementation"""
         if self.is_moving:
-            print(f"🛬 {self.name} is beginning descent...")
-            self.altitude = 0
-            print(f"🛬 {self.name} is landing on runway...")
-            time.sleep(1)
-            self.current_speed = 0
-            self.is_moving = False
-            self.is_airborne = False
+            print(f"🛬 {self.name} is beginning descent...\n"
+                  f"🛬 {self.name} is landing on runway...")
+            if self._ANIMATE:
+                time.sleep(1)
+            self._halt()
             print(f"✈️ {self.name} has landed and is at the gate.")
         else:
             print(f"✈️ {self.name} is already on the ground!")
     
+    def _halt(self):
+        """Plane-specific rest state: back on the ground"""
+        super()._halt()
+        self.altitude = 0
+        self.is_airborne = False
+    
     def make_sound(self):
         """Plane-specific sound"""
-        sounds = ["WHOOOOSH! 🌪️", "Jet engines roaring! ✈️", "Turbulence rumbling... 🌩️"]
-        print(f"🔊 {random.choice(sounds)}")
+        print(f"🔊 {_choice(self._SOUNDS)}")
     
     def climb_altitude(self, target_altitude):
         """Plane-specific method"""
@@ -169,6 +217,9 @@ class Plane(Vehicle):
 class Boat(Vehicle):
     """Boat class with specific movement behavior"""
     
+    __slots__ = ('anchor_down',)
+    _SOUNDS = ("Splash splash! 🌊", "Foghorn: HOOOONK! 📯", "Waves lapping... 🌊")
+    
     def __init__(self, name, max_speed=60, capacity=50):
         super().__init__(name, max_speed, "Diesel", capacity)
         self.anchor_down = True
@@ -179,11 +230,12 @@ class Boat(Vehicle):
             if self.anchor_down:
                 print(f"⚓ Raising anchor for {self.name}...")
                 self.anchor_down = False
-                time.sleep(0.5)
-            print(f"🚤 {self.name} is sailing across the water...")
+                if self._ANIMATE:
+                    time.sleep(0.5)
             self.is_moving = True
             self.current_speed = 25
-            print(f"⛵ {self.name} is cruising at {self.current_speed} km/h")
+            print(f"🚤 {self.name} is sailing across the water...\n"
+                  f"⛵ {self.name} is cruising at {self.current_speed} km/h")
             self.make_sound()
         else:
             print(f"⛵ {self.name} is already sailing!")
@@ -191,19 +243,21 @@ class Boat(Vehicle):
     def stop(self):
         """Boat-specific stopping implementation"""
         if self.is_moving:
-            print(f"🛑 {self.name} is slowing down...")
-            self.current_speed = 0
-            self.is_moving = False
-            print(f"⚓ Dropping anchor for {self.name}...")
-            self.anchor_down = True
-            print(f"⛵ {self.name} is anchored at port.")
+            self._halt()
+            print(f"🛑 {self.name} is slowing down...\n"
+                  f"⚓ Dropping anchor for {self.name}...\n"
+                  f"⛵ {self.name} is anchored at port.")
         else:
             print(f"⛵ {self.name} is already anchored!")
     
+    def _halt(self):
+        """Boat-specific rest state: anchored"""
+        super()._halt()
+        self.anchor_down = True
+    
     def make_sound(self):
         """Boat-specific sound"""
-        sounds = ["Splash splash! 🌊", "Foghorn: HOOOONK! 📯", "Waves lapping... 🌊"]
-        print(f"🔊 {random.choice(sounds)}")
+        print(f"🔊 {_choice(self._SOUNDS)}")
     
     def drop_anchor(self):
         """Boat-specific method"""
@@ -216,6 +270,9 @@ class Boat(Vehicle):
 class Bicycle(Vehicle):
     """Bicycle class with specific movement behavior"""
     
+    __slots__ = ('pedaling', 'gear')
+    _SOUNDS = ("Ring ring! 🔔", "Whoosh of wind! 💨", "Chain clicking... ⚙️")
+    
     def __init__(self, name, max_speed=40, capacity=2):
         super().__init__(name, max_speed, "Human Power", capacity)
         self.pedaling = False
@@ -224,11 +281,11 @@ class Bicycle(Vehicle):
     def move(self):
         """Bicycle-specific movement implementation"""
         if not self.is_moving:
-            print(f"🚴 Starting to pedal {self.name}...")
             self.is_moving = True
             self.pedaling = True
             self.current_speed = 15
-            print(f"🚴 {self.name} is cycling at {self.current_speed} km/h")
+            print(f"🚴 Starting to pedal {self.name}...\n"
+                  f"🚴 {self.name} is cycling at {self.current_speed} km/h")
             self.make_sound()
         else:
             print(f"🚴 {self.name} is already cycling!")
@@ -236,18 +293,20 @@ class Bicycle(Vehicle):
     def stop(self):
         """Bicycle-specific stopping implementation"""
         if self.is_moving:
-            print(f"🛑 Applying brakes to {self.name}...")
-            self.current_speed = 0
-            self.is_moving = False
-            self.pedaling = False
-            print(f"🚴 {self.name} has stopped.")
+            self._halt()
+            print(f"🛑 Applying brakes to {self.name}...\n"
+                  f"🚴 {self.name} has stopped.")
         else:
             print(f"🚴 {self.name} is already stopped!")
     
+    def _halt(self):
+        """Bicycle-specific rest state: not pedaling"""
+        super()._halt()
+        self.pedaling = False
+    
     def make_sound(self):
         """Bicycle-specific sound"""
-        sounds = ["Ring ring! 🔔", "Whoosh of wind! 💨", "Chain clicking... ⚙️"]
-        print(f"🔊 {random.choice(sounds)}")
+        print(f"🔊 {_choice(self._SOUNDS)}")
     
     def ring_bell(self):
         """Bicycle-specific method"""
@@ -256,6 +315,9 @@ class Bicycle(Vehicle):
 class Train(Vehicle):
     """Train class with specific movement behavior"""
     
+    __slots__ = ('cars', 'station')
+    _SOUNDS = ("Choo choo! 🚂", "TOOT TOOT! 📯", "Clackety-clack on tracks... 🛤️")
+    
     def __init__(self, name, max_speed=300, capacity=500):
         super().__init__(name, max_speed, "Electric", capacity)
         self.cars = 8
@@ -265,11 +327,12 @@ class Train(Vehicle):
         """Train-specific movement implementation"""
         if not self.is_moving:
             print(f"🚂 All aboard! {self.name} is departing from {self.station}...")
-            time.sleep(1)
-            print(f"🚂 {self.name} is accelerating on the tracks...")
+            if self._ANIMATE:
+                time.sleep(1)
             self.is_moving = True
             self.current_speed = 80
-            print(f"🚃 {self.name} is traveling at {self.current_speed} km/h on the railway")
+            print(f"🚂 {self.name} is accelerating on the tracks...\n"
+                  f"🚃 {self.name} is traveling at {self.current_speed} km/h on the railway")
             self.make_sound()
         else:
             print(f"🚃 {self.name} is already traveling!")
@@ -277,19 +340,18 @@ class Train(Vehicle):
     def stop(self):
         """Train-specific stopping implementation"""
         if self.is_moving:
-            print(f"🛑 {self.name} is approaching the next station...")
-            print(f"🚂 Brakes engaging for {self.name}...")
-            time.sleep(1)
-            self.current_speed = 0
-            self.is_moving = False
+            print(f"🛑 {self.name} is approaching the next station...\n"
+                  f"🚂 Brakes engaging for {self.name}...")
+            if self._ANIMATE:
+                time.sleep(1)
+            self._halt()
             print(f"🚃 {self.name} has arrived at the station. Doors opening...")
         else:
             print(f"🚃 {self.name} is already at the station!")
     
     def make_sound(self):
         """Train-specific sound"""
-        sounds = ["Choo choo! 🚂", "TOOT TOOT! 📯", "Clackety-clack on tracks... 🛤️"]
-        print(f"🔊 {random.choice(sounds)}")
+        print(f"🔊 {_choice(self._SOUNDS)}")
     
     def change_station(self, new_station):
         """Train-specific method"""
@@ -299,7 +361,36 @@ class Train(Vehicle):
 
 def demonstrate_polymorphism():
     """Demonstrate polymorphism with different vehicles"""
-    print("🎭 " + "="*60)
-    print("        ACTIVITY 2: POLYMORPHISM CHALLENGE")
-    print("="*65)
-    print("Same methods, different behaviors!
\ No newline at end of file
+    # Pauses are only for the demo; restore the flag so later use stays fast
+    old_animate = Vehicle._ANIMATE
+    Vehicle._ANIMATE = True
+    try:
+        print("🎭 " + _SUBBAR)
+        print("        ACTIVITY 2: POLYMORPHISM CHALLENGE")
+        print(_BANNER)
+        print("Same methods, different behaviors!")
+        
+        vehicles = [
+            Car("Tesla Model S"),
+            Plane("Boeing 747"),
+            Boat("Ocean Explorer"),
+            Bicycle("Mountain Bike"),
+            Train("Express Line"),
+        ]
+        
+        # Same method calls, each vehicle responds in its own way
+        for vehicle in vehicles:
+            print(f"\n--- {vehicle} ---")
+            vehicle.move()
+            vehicle.accelerate(20)
+            vehicle.stop()
+        
+        print("\n📊 Vehicle Summary:")
+        for vehicle in vehicles:
+            print("\n".join(f"   {key}: {value}" for key, value in vehicle.get_info().items()))
+            print()
+    finally:
+        Vehicle._ANIMATE = old_animate
+
+if __name__ == "__main__":
+    demonstrate_polymorphism()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Optional Cython build for the class modules ⚙️
+==============================================
+When Cython 3+ is available at build time, smartphone.py and
+polymorphism.py are compiled unchanged (pure-Python mode) into extension
+modules. Without it they are installed as plain Python modules, so no C
+compiler is needed. fleet.py is always plain Python; its kernel is
+compiled by Numba.
+
+Usage:
+    pip install .                       # plain Python install
+    pip install .[fleet]                # adds NumPy for fleet.py
+    pip install .[jit]                  # adds NumPy and Numba for the kernel
+    pip install "Cython>=3" && pip install --no-build-isolation .
+                                        # compiled install
+    python setup.py build_ext --inplace # compile next to the sources
+
+Note: build_ext --inplace leaves .so files beside the .py files and Python
+imports the .so first, so later edits to the .py files are ignored until
+the .so files are deleted or rebuilt.
+"""
+
+from setuptools import Extension, setup
+
+try:
+    import Cython
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+else:
+    # The metaclass and __init_subclass__ code needs Cython 3
+    if int(Cython.__version__.split(".")[0]) < 3:
+        cythonize = None
+
+CLASS_MODULES = ["smartphone", "polymorphism"]
+
+if cythonize is not None:
+    ext_modules = cythonize(
+        [Extension(name, [f"{name}.py"]) for name in CLASS_MODULES],
+        compiler_directives={
+            'language_level': 3,
+            'boundscheck': False,
+            'wraparound': False,
+        },
+    )
+    py_modules = ["fleet"]
+else:
+    ext_modules = []
+    py_modules = ["fleet"] + CLASS_MODULES
+
+setup(
+    name="week5-python-assignment",
+    py_modules=py_modules,
+    extras_require={
+        'fleet': ["numpy"],
+        'jit': ["numpy", "numba"],
+    },
+    ext_modules=ext_modules,
+)
@@ -13,6 +13,28 @@ This program demonstrates:
 from datetime import datetime
 import random
 
+_randint = random.randint
+
+_BANNER = "=" * 65
+_SUBBAR = "=" * 60
+
+# Interactive menus, pre-joined so each is written with a single print()
+_MAIN_MENU = "\n".join([
+    "\nChoose an action:",
+    "1. 📱 Smartphone operations",
+    "2. 💻 Laptop operations",
+    "3. 📊 Show device statistics",
+    "4. 🔋 Charge phone battery",
+    "5. ❌ Exit",
+])
+_PHONE_MENU = "\n".join([
+    "\nSmartphone Operations:",
+    "a. Install app",
+    "b. Take photo",
+    "c. Make call",
+    "d. Lock/unlock screen",
+])
+
 # Base class demonstrating inheritance
 class Electronics:
     """Base class for all electronic devices"""
@@ -20,6 +42,9 @@ class Electronics:
     # Class variable (shared by all instances)
     total_devices = 0
     
+    __slots__ = ('brand', 'model', 'price', 'warranty_years', '_serial_number',
+                 '_manufacture_date', '_is_on', '_power_consumption')
+    
     def __init__(self, brand, model, price, warranty_years=1):
         """Initialize electronic device"""
         # Public attributes
@@ -32,9 +57,9 @@ class Electronics:
         self._serial_number = self._generate_serial()
         self._manufacture_date = datetime.now().strftime("%Y-%m-%d")
         
-        # Private attributes (indicated by double underscore)
-        self.__is_on = False
-        self.__power_consumption = 0
+        # Protected power state
+        self._is_on = False
+        self._power_consumption = 0
         
         # Increment class variable
         Electronics.total_devices += 1
@@ -43,22 +68,22 @@ class Electronics:
     
     def _generate_serial(self):
         """Protected method to generate serial number"""
-        return f"SN{random.randint(100000, 999999)}"
+        return f"SN{_randint(100000, 999999)}"
     
     def power_on(self):
         """Turn on the device"""
-        if not self.__is_on:
-            self.__is_on = True
-            self.__power_consumption = self._get_base_power_consumption()
+        if not self._is_on:
+            self._is_on = True
+            self._power_consumption = self._get_base_power_consumption()
             print(f"🔋 {self.brand} {self.model} is now ON")
         else:
             print(f"⚠️ {self.brand} {self.model} is already ON")
     
     def power_off(self):
         """Turn off the device"""
-        if self.__is_on:
-            self.__is_on = False
-            self.__power_consumption = 0
+        if self._is_on:
+            self._is_on = False
+            self._power_consumption = 0
             print(f"⚫ {self.brand} {self.model} is now OFF")
         else:
             print(f"⚠️ {self.brand} {self.model} is already OFF")
@@ -69,7 +94,7 @@ class Electronics:
     
     def get_device_info(self):
         """Get comprehensive device information"""
-        status = "ON" if self.__is_on else "OFF"
+        status = "ON" if self._is_on else "OFF"
         return {
             'brand': self.brand,
             'model': self.model,
@@ -78,7 +103,7 @@ class Electronics:
             'manufacture_date': self._manufacture_date,
             'warranty_years': self.warranty_years,
             'status': status,
-            'power_consumption': self.__power_consumption
+            'power_consumption': self._power_consumption
         }
     
     def is_under_warranty(self):
@@ -98,6 +123,10 @@ class Electronics:
 class Smartphone(Electronics):
     """Smartphone class inheriting from Electronics"""
     
+    __slots__ = ('os', '_storage_gb', '_camera_mp', 'battery_mah', '_contacts',
+                 '_apps_installed', '_max_apps', '_battery_level', '_screen_locked',
+                 '_photo_quality', '_photo_template')
+    
     def __init__(self, brand, model, price, os, storage_gb, camera_mp, battery_mah, warranty_years=2):
         """Initialize smartphone with specific attributes"""
         # Call parent constructor
@@ -105,18 +134,34 @@ class Smartphone(Electronics):
         
         # Smartphone-specific attributes
         self.os = os
-        self.storage_gb = storage_gb
-        self.camera_mp = camera_mp
+        self._storage_gb = storage_gb  # Read-only: the app limit is derived from it
+        self._camera_mp = camera_mp  # Read-only: photo quality is derived from it
         self.battery_mah = battery_mah
         
-        # Private smartphone attributes
-        self.__contacts = []
-        self.__apps_installed = ["Phone", "Messages", "Settings"]
-        self.__battery_level = 100
-        self.__screen_locked = True
+        # Internal smartphone state
+        self._contacts = {}  # keyed by lowercased name
+        # Dict keys give O(1) lookups while keeping install order
+        self._apps_installed = dict.fromkeys(["Phone", "Messages", "Settings"])
+        self._max_apps = storage_gb // 4  # Rough storage calculation
+        self._battery_level = 100
+        self._screen_locked = True
+        
+        # Decide photo quality and file name pattern once
+        self._photo_quality = "HD" if camera_mp >= 12 else "Standard"
+        self._photo_template = f"{self._photo_quality}_photo_{{ts}}.jpg"
         
         print(f"📱 Smartphone initialized with {storage_gb}GB storage and {camera_mp}MP camera")
     
+    @property
+    def storage_gb(self):
+        """Storage size in GB (fixed at construction)"""
+        return self._storage_gb
+    
+    @property
+    def camera_mp(self):
+        """Camera resolution in megapixels (fixed at construction)"""
+        return self._camera_mp
+    
     # Override parent method (polymorphism)
     def _get_base_power_consumption(self):
         """Override to provide smartphone-specific power consumption"""
@@ -124,9 +169,9 @@ class Smartphone(Electronics):
     
     def unlock_screen(self, passcode="1234"):
         """Unlock the smartphone screen"""
-        if self.__screen_locked:
+        if self._screen_locked:
             if passcode == "1234":  # Simple passcode for demo
-                self.__screen_locked = False
+                self._screen_locked = False
                 print("🔓 Screen unlocked successfully!")
                 return True
             else:
@@ -138,17 +183,16 @@ class Smartphone(Electronics):
     
     def lock_screen(self):
         """Lock the smartphone screen"""
-        if not self.__screen_locked:
-            self.__screen_locked = True
+        if not self._screen_locked:
+            self._screen_locked = True
             print("🔒 Screen locked")
         else:
             print("ℹ️ Screen is already locked")
     
     def add_contact(self, name, phone_number):
         """Add a new contact"""
-        if not self.__screen_locked:
-            contact = {"name": name, "phone": phone_number}
-            self.__contacts.append(contact)
+        if not self._screen_locked:
+            self._contacts[name.lower()] = {"name": name, "phone": phone_number}
             print(f"👤 Contact added: {name} - {phone_number}")
             return True
         else:
@@ -157,12 +201,12 @@ class Smartphone(Electronics):
     
     def install_app(self, app_name):
         """Install a new app"""
-        if not self.__screen_locked:
-            if app_name not in self.__apps_installed:
+        if not self._screen_locked:
+            if app_name not in self._apps_installed:
                 # Simulate storage check
-                if len(self.__apps_installed) < (self.storage_gb // 4):  # Rough calculation
-                    self.__apps_installed.append(app_name)
-                    self.__battery_level -= 2  # Installing apps uses battery
+                if len(self._apps_installed) < self._max_apps:
+                    self._apps_installed[app_name] = None
+                    self._battery_level -= 2  # Installing apps uses battery
                     print(f"📲 App installed: {app_name}")
                     return True
                 else:
@@ -177,12 +221,11 @@ class Smartphone(Electronics):
     
     def take_photo(self):
         """Take a photo using the camera"""
-        if not self.__screen_locked:
-            if self.__battery_level > 5:
-                self.__battery_level -= 3
-                photo_quality = "HD" if self.camera_mp >= 12 else "Standard"
-                print(f"📸 Photo taken! Quality: {photo_quality} ({self.camera_mp}MP)")
-                return f"{photo_quality}_photo_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jpg"
+        if not self._screen_locked:
+            if self._battery_level > 5:
+                self._battery_level -= 3
+                print(f"📸 Photo taken! Quality: {self._photo_quality} ({self._camera_mp}MP)")
+                return self._photo_template.format(ts=datetime.now().strftime('%Y%m%d_%H%M%S'))
             else:
                 print("🔋 Battery too low to take photo!")
                 return None
@@ -192,11 +235,11 @@ class Smartphone(Electronics):
     
     def make_call(self, contact_name):
         """Make a phone call"""
-        if not self.__screen_locked:
-            contact = next((c for c in self.__contacts if c["name"].lower() == contact_name.lower()), None)
+        if not self._screen_locked:
+            contact = self._contacts.get(contact_name.lower())
             if contact:
-                if self.__battery_level > 10:
-                    self.__battery_level -= 5
+                if self._battery_level > 10:
+                    self._battery_level -= 5
                     print(f"📞 Calling {contact['name']} at {contact['phone']}...")
                     return True
                 else:
@@ -211,47 +254,45 @@ class Smartphone(Electronics):
     
     def check_battery(self):
         """Check current battery level"""
-        battery_status = "🔋" if self.__battery_level > 20 else "🪫"
-        print(f"{battery_status} Battery Level: {self.__battery_level}%")
-        return self.__battery_level
+        battery_status = "🔋" if self._battery_level > 20 else "🪫"
+        print(f"{battery_status} Battery Level: {self._battery_level}%")
+        return self._battery_level
     
     def charge_battery(self, amount=50):
         """Charge the battery"""
-        old_level = self.__battery_level
-        self.__battery_level = min(100, self.__battery_level + amount)
-        gained = self.__battery_level - old_level
-        print(f"🔌 Charged! Battery: {old_level}% → {self.__battery_level}% (+{gained}%)")
+        old_level = self._battery_level
+        self._battery_level = min(100, self._battery_level + amount)
+        gained = self._battery_level - old_level
+        print(f"🔌 Charged! Battery: {old_level}% → {self._battery_level}% (+{gained}%)")
     
     def get_contacts(self):
         """Get all contacts (read-only)"""
-        if not self.__screen_locked:
-            return self.__contacts.copy()  # Return copy to maintain encapsulation
+        if not self._screen_locked:
+            return list(self._contacts.values())  # Return copy to maintain encapsulation
         else:
             print("🔒 Please unlock screen first!")
             return []
     
     def get_installed_apps(self):
         """Get list of installed apps"""
-        if not self.__screen_locked:
-            return self.__apps_installed.copy()
+        if not self._screen_locked:
+            return list(self._apps_installed)
         else:
             print("🔒 Please unlock screen first!")
             return []
     
     def get_smartphone_info(self):
         """Get comprehensive smartphone information"""
-        base_info = super().get_device_info()
-        smartphone_info = {
-            'os': self.os,
-            'storage_gb': self.storage_gb,
-            'camera_mp': self.camera_mp,
-            'battery_mah': self.battery_mah,
-            'battery_level': self.__battery_level,
-            'screen_locked': self.__screen_locked,
-            'contacts_count': len(self.__contacts),
-            'apps_installed': len(self.__apps_installed)
-        }
-        return {**base_info, **smartphone_info}
+        info = super().get_device_info()  # Fresh dict, extended in place
+        info['os'] = self.os
+        info['storage_gb'] = self.storage_gb
+        info['camera_mp'] = self.camera_mp
+        info['battery_mah'] = self.battery_mah
+        info['battery_level'] = self._battery_level
+        info['screen_locked'] = self._screen_locked
+        info['contacts_count'] = len(self._contacts)
+        info['apps_installed'] = len(self._apps_installed)
+        return info
     
     def __str__(self):
         """String representation of smartphone"""
@@ -261,14 +302,16 @@ class Smartphone(Electronics):
 class Laptop(Electronics):
     """Laptop class inheriting from Electronics"""
     
+    __slots__ = ('os', 'ram_gb', 'storage_gb', 'screen_size', '_programs_running', '_cpu_usage')
+    
     def __init__(self, brand, model, price, os, ram_gb, storage_gb, screen_size, warranty_years=3):
         super().__init__(brand, model, price, warranty_years)
         self.os = os
         self.ram_gb = ram_gb
         self.storage_gb = storage_gb
         self.screen_size = screen_size
-        self.__programs_running = []
-        self.__cpu_usage = 0
+        self._programs_running = []
+        self._cpu_usage = 0
     
     def _get_base_power_consumption(self):
         """Override for laptop-specific power consumption"""
@@ -276,40 +319,38 @@ class Laptop(Electronics):
     
     def run_program(self, program_name):
         """Run a program on the laptop"""
-        if program_name not in self.__programs_running:
-            self.__programs_running.append(program_name)
-            self.__cpu_usage += random.randint(5, 15)
-            print(f"💻 Running: {program_name} (CPU: {self.__cpu_usage}%)")
+        if program_name not in self._programs_running:
+            self._programs_running.append(program_name)
+            self._cpu_usage += _randint(5, 15)
+            print(f"💻 Running: {program_name} (CPU: {self._cpu_usage}%)")
         else:
             print(f"ℹ️ {program_name} is already running")
     
     def close_program(self, program_name):
         """Close a running program"""
-        if program_name in self.__programs_running:
-            self.__programs_running.remove(program_name)
-            self.__cpu_usage = max(0, self.__cpu_usage - random.randint(5, 15))
-            print(f"❌ Closed: {program_name} (CPU: {self.__cpu_usage}%)")
+        if program_name in self._programs_running:
+            self._programs_running.remove(program_name)
+            self._cpu_usage = max(0, self._cpu_usage - _randint(5, 15))
+            print(f"❌ Closed: {program_name} (CPU: {self._cpu_usage}%)")
         else:
             print(f"ℹ️ {program_name} is not running")
     
     def get_system_info(self):
         """Get laptop system information"""
-        base_info = super().get_device_info()
-        laptop_info = {
-            'os': self.os,
-            'ram_gb': self.ram_gb,
-            'storage_gb': self.storage_gb,
-            'screen_size': self.screen_size,
-            'cpu_usage': self.__cpu_usage,
-            'running_programs': len(self.__programs_running)
-        }
-        return {**base_info, **laptop_info}
+        info = super().get_device_info()
+        info['os'] = self.os
+        info['ram_gb'] = self.ram_gb
+        info['storage_gb'] = self.storage_gb
+        info['screen_size'] = self.screen_size
+        info['cpu_usage'] = self._cpu_usage
+        info['running_programs'] = len(self._programs_running)
+        return info
 
 def demonstrate_classes():
-    """Demonstrate the classes and their capabilities"""
-    print("🏗️ " + "="*60)
-    print("        ASSIGNMENT 1: CLASS DESIGN DEMONSTRATION")
-    print("="*65)
+    """Demonstrate the classes and their capabilities (no user input)"""
+    print(f"🏗️ {_SUBBAR}\n"
+          f"        ASSIGNMENT 1: CLASS DESIGN DEMONSTRATION\n"
+          f"{_BANNER}")
     
     # Create Electronics instances
     print("\n📱 Creating Smartphone...")
@@ -358,55 +399,55 @@ def demonstrate_classes():
     phone.check_battery()
     
     # Demonstrate inheritance
+    # Each info block is joined and written with a single print()
     print("\n🏗️ Demonstrating Inheritance - Device Information:")
     print("\n📱 Smartphone Info:")
     smartphone_info = phone.get_smartphone_info()
-    for key, value in smartphone_info.items():
-        print(f"   {key}: {value}")
+    print("\n".join(f"   {key}: {value}" for key, value in smartphone_info.items()))
     
     print("\n💻 Laptop Info:")
     laptop_info = laptop.get_system_info()
-    for key, value in laptop_info.items():
-        print(f"   {key}: {value}")
+    print("\n".join(f"   {key}: {value}" for key, value in laptop_info.items()))
     
     # Demonstrate method overriding
     print("\n⚡ Demonstrating Method Overriding - Power Consumption:")
     base_electronics = Electronics("Generic", "Device", 99.99)
     base_electronics.power_on()
     
-    # Interactive demonstration
-    print("\n" + "="*60)
-    print("🎮 INTERACTIVE DEMONSTRATION")
-    print("="*60)
+    return phone, laptop
+
+def _repl(phone, laptop):
+    """Interactive demonstration driven by user input"""
+    print(f"\n{_SUBBAR}\n🎮 INTERACTIVE DEMONSTRATION\n{_SUBBAR}")
+    
+    # Bind the methods the loop calls once, outside the loop
+    install = phone.install_app
+    take_photo = phone.take_photo
+    make_call = phone.make_call
+    check_batt = phone.check_battery
+    get_contacts = phone.get_contacts
+    get_apps = phone.get_installed_apps
+    run_prog = laptop.run_program
     
     while True:
-        print("\nChoose an action:")
-        print("1. 📱 Smartphone operations")
-        print("2. 💻 Laptop operations") 
-        print("3. 📊 Show device statistics")
-        print("4. 🔋 Charge phone battery")
-        print("5. ❌ Exit")
+        print(_MAIN_MENU)
         
         try:
             choice = input("Enter choice (1-5): ").strip()
             
             if choice == '1':
-                print("\nSmartphone Operations:")
-                print("a. Install app")
-                print("b. Take photo") 
-                print("c. Make call")
-                print("d. Lock/unlock screen")
+                print(_PHONE_MENU)
                 
                 sub_choice = input("Choose (a-d): ").strip().lower()
                 
                 if sub_choice == 'a':
                     app_name = input("Enter app name: ").strip()
-                    phone.install_app(app_name)
+                    install(app_name)
                 elif sub_choice == 'b':
-                    phone.take_photo()
+                    take_photo()
                 elif sub_choice == 'c':
                     contact_name = input("Enter contact name: ").strip()
-                    phone.make_call(contact_name)
+                    make_call(contact_name)
                 elif sub_choice == 'd':
                     if phone.get_smartphone_info()['screen_locked']:
                         phone.unlock_screen()
@@ -416,14 +457,14 @@ def demonstrate_classes():
             elif choice == '2':
                 print("\nLaptop Operations:")
                 program = input("Enter program to run: ").strip()
-                laptop.run_program(program)
+                run_prog(program)
             
             elif choice == '3':
                 print(f"\n📊 Device Statistics:")
                 print(f"Total devices created: {Electronics.total_devices}")
-                print(f"Phone battery: {phone.check_battery()}%")
-                print(f"Phone contacts: {len(phone.get_contacts())}")
-                print(f"Phone apps: {len(phone.get_installed_apps())}")
+                print(f"Phone battery: {check_batt()}%")
+                print(f"Phone contacts: {len(get_contacts())}")
+                print(f"Phone apps: {len(get_apps())}")
             
             elif choice == '4':
                 amount = input("Enter charge amount (default 50): ").strip()
@@ -444,4 +485,5 @@ def demonstrate_classes():
             print(f"❌ Error: {e}")
 
 if __name__ == "__main__":
-    demonstrate_classes()
\ No newline at end of file
+    phone, laptop = demonstrate_classes()
+    _repl(phone, laptop)
@@ -0,0 +1,66 @@
+"""Tests for the fleet simulator in fleet.py"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import fleet
+from polymorphism import Boat, Car, Plane
+
+def make_arrays(size=1000, seed=0):
+    """Random fleet state as the tuple of arrays step() expects"""
+    rng = np.random.default_rng(seed)
+    current = rng.uniform(0, 100, size).astype(np.float32)
+    max_speed = rng.uniform(40, 900, size).astype(np.float32)
+    fuel = rng.uniform(0, 1, size).astype(np.float32)  # some run dry
+    distance = np.zeros(size, dtype=np.float32)
+    moving = rng.random(size) < 0.5
+    return current, max_speed, fuel, distance, moving
+
+def test_numba_step_matches_python_step():
+    pytest.importorskip("numba")
+    compiled = make_arrays()
+    python = make_arrays()
+    for _ in range(120):
+        fleet.step(1/60, 5.0, 0.01, *compiled)
+        fleet.step.py_func(1/60, 5.0, 0.01, *python)
+    for got, expected in zip(compiled, python):
+        np.testing.assert_allclose(got, expected, rtol=1e-5)
+
+def test_step_out_of_fuel_stops_vehicle():
+    current = np.array([50.0], dtype=np.float32)
+    max_speed = np.array([100.0], dtype=np.float32)
+    fuel = np.array([0.015], dtype=np.float32)
+    distance = np.zeros(1, dtype=np.float32)
+    moving = np.array([True])
+    fleet.step(1.0, 5.0, 0.01, current, max_speed, fuel, distance, moving)
+    assert moving[0] and current[0] == 55.0
+    fleet.step(1.0, 5.0, 0.01, current, max_speed, fuel, distance, moving)
+    assert not moving[0]
+    assert current[0] == 0.0 and fuel[0] == 0.0
+    assert distance[0] == pytest.approx(115.0)
+
+def test_apply_to_resets_subclass_state_when_out_of_fuel():
+    plane = Plane("Test Plane")
+    plane.move()
+    vehicles = [plane]
+    fleet_ = fleet.VehicleFleet.from_vehicles(vehicles)
+    fleet_.simulate(ticks=20000)
+    fleet_.apply_to(vehicles)
+    assert not plane.is_moving
+    assert plane.current_speed == 0
+    assert not plane.is_airborne
+    assert plane.altitude == 0
+
+def test_apply_to_keeps_untouched_vehicles_unchanged():
+    boat = Boat("Idle Boat")
+    car = Car("Test Car")
+    car.move()
+    vehicles = [boat, car]
+    before = boat.get_info()
+    fleet_ = fleet.VehicleFleet.from_vehicles(vehicles)
+    fleet_.simulate(ticks=10)
+    fleet_.apply_to(vehicles)
+    assert boat.get_info() == before
+    assert type(boat.fuel_level) is int and type(boat.current_speed) is int
+    assert car.is_moving and car.current_speed == 80